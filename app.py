@@ -1,6 +1,13 @@
 # --- core imports
-import os, io, json, uuid, datetime
-from flask import Flask, render_template, request, redirect, url_for, flash, send_file, jsonify
+import os, io, re, json, uuid, hashlib, datetime, itertools, functools, mmap, tempfile, contextlib, threading
+try:
+    import fcntl  # POSIX file locks
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+from collections import defaultdict, Counter, namedtuple
+import orjson
+from flask import Flask, render_template, request, redirect, url_for, flash, send_file, jsonify, g
 from flask_login import (
     LoginManager, UserMixin, login_user, login_required, current_user, logout_user
 )
@@ -9,6 +16,8 @@ from werkzeug.security import generate_password_hash, check_password_hash
 # --- Flask app first
 app = Flask(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret")
+app.json.sort_keys = False  # keep field order in jsonify() output; skips a sort per dict
+app.json.compact = True     # no indent/newlines in jsonify() output, even with debug on
 
 # --- paths & simple JSON helpers (used by auth bootstrap)
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -26,16 +35,48 @@ DATA_DIR = _default_data_dir()
 
 ACCOUNTS_PATH = os.path.join(DATA_DIR, "accounts.json")
 
+def _json_loads(raw):
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # Files written by the old json.dump() may hold NaN/Infinity, which
+        # orjson rejects; the stdlib still reads them (and the next save
+        # writes strict JSON).
+        return json.loads(bytes(raw))
+
 def load_json(path):
     if not os.path.exists(path):
         return []
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+# mkstemp() creates 0600 files; saved JSON keeps the usual umask-based mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 def save_json(path, data):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    # Write compact JSON to a sibling temp file, then atomically swap it in,
+    # so readers never see a half-written file. Pretty-print only when debugging.
+    # The temp name is unique per call, so concurrent writers (threads or
+    # processes) never share one.
+    dirname = os.path.dirname(path)
+    os.makedirs(dirname, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=dirname, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if app.debug else 0))
+            f.flush()
+            st = os.fstat(f.fileno())
+        # path-based chmod after closing: os.fchmod is missing on Windows < 3.13
+        os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return st  # stat of what *this* call wrote (rename keeps mtime/size)
 
 def new_id():
     return uuid.uuid4().hex[:10]
@@ -95,6 +136,8 @@ def _bootstrap_admin():
 
 
 MATTERS_PATH = os.path.join(DATA_DIR, "matters.json")
+MATTERS_LOG_PATH = os.path.join(DATA_DIR, "matters.log")  # journal of edits since the last full write
+MATTERS_LOCK_PATH = os.path.join(DATA_DIR, "matters.lock")  # serializes journal appends / snapshot rewrites
 USERS_PATH = os.path.join(DATA_DIR, "users.json")
 AUDIT_PATH    = os.path.join(DATA_DIR, "audit.json")     
 
@@ -120,6 +163,13 @@ FIELDS = [
     "Total Cycle Time",
     "Owner",
 ]
+FIELDS_SET = frozenset(FIELDS)
+
+# Fields offered as dropdown filters on the matters list
+FILTER_FIELDS = [
+    "Group Entity","Counterparty","Branch","Legal","Internal Dept",
+    "Contract Type","Internal Stakeholder","Who With","Stage","Overall Status"
+]
 
 ALLOWED_STATUSES = [
     "Received/Under Review",
@@ -150,6 +200,13 @@ def normalize_date(date_str):
     # Accepts DD/MM/YYYY or YYYY-MM-DD; returns YYYY-MM-DD
     if not date_str:
         return ""
+    if not isinstance(date_str, str):
+        return date_str  # e.g. a number posted via the API: leave as-is
+    # Fast path: already YYYY-MM-DD. strptime would hand back the same string
+    # (or fail and return it as-is), so skip it.
+    if (len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-"
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+        return date_str
     try:
         if "/" in date_str:
             d = datetime.datetime.strptime(date_str, "%d/%m/%Y").date()
@@ -206,8 +263,8 @@ def audit_log(action, matter_id, before=None, after=None, fields_changed=None, n
         "matter_id": matter_id,
         "fields_changed": fields_changed or [],
         "note": note,
-        "before": before or {},
-        "after":  after or {},
+        "before": strip_derived(before or {}),
+        "after":  strip_derived(after or {}),
     }
     append_audit(evt)
 
@@ -220,45 +277,402 @@ def diff_fields(before: dict, after: dict):
 
 
 
-def get_matters():
-    data = load_json(MATTERS_PATH)
+# Parsed matters kept in memory between requests, keyed by the (mtime_ns, size)
+# of matters.json and its journal; a change to either on disk is re-read on the
+# next call.
+_MATTERS_CACHE = {"tag": None, "data": None}
 
-    # Optional legacy key fixer (safe to keep)
-    LEGACY_TO_CANON = {
-        "Date": "Date Received",
-        "Group": "Group Entity",
-        "Status": "Overall Status",
-    }
-    def canonicalize_matter_keys(m: dict) -> dict:
-        for old, new in LEGACY_TO_CANON.items():
-            if old in m and new not in m:
-                m[new] = m.pop(old)
-        return m
+def _stat_tag(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
-    changed = False
-    for m in data:
-        canonicalize_matter_keys(m)
-        if not m.get("id"):
-            m["id"] = new_id()
-            changed = True
-        for f in FIELDS:
-            if f not in m:
-                m[f] = ""
+def _matters_tag():
+    snap, log = _stat_tag(MATTERS_PATH), _stat_tag(MATTERS_LOG_PATH)
+    if snap is None and log is None:
+        return None
+    return (snap, log)
 
-    # ✨ Persist any ids we just generated so they remain stable across requests
-    if changed:
-        write_matters(data)
+def _backfill_id(m: dict, pos: int) -> str:
+    # Deterministic id for a stored row that has none: same file -> same id in
+    # every worker and after restarts, so the read path never has to write the
+    # file just to pin ids down. The next write_matters() persists it.
+    raw = orjson.dumps(strip_derived(m), option=orjson.OPT_SORT_KEYS) + b"#%d" % pos
+    return hashlib.sha1(raw).hexdigest()[:10]
+
+def _normalize_matters(data, stored=False):
+    """Canonicalize keys, backfill ids/FIELDS and (re)build derived keys in place.
 
+    `stored=True` for rows read back from disk: a missing id is derived from
+    the row (stable across workers). Rows on their way in get a new_id().
+    """
+    for pos, m in enumerate(data):
+        canonicalize_matter_keys(m)
+        if not m.get("id"):
+            m["id"] = _backfill_id(m, pos) if stored else new_id()
+        # backfill absent FIELDS (kept in FIELDS order); complete rows skip this
+        missing = FIELDS_SET.difference(m)
+        if missing:
+            m.update({f: "" for f in FIELDS if f in missing})
+
+        # In-memory only (stripped on write): lowercased text of every field for
+        # the list search, plus the per-row values the dashboard aggregates use
+        m["_search_blob"] = " ".join("" if m[f] is None else str(m[f]) for f in FIELDS).lower()
+        m["_status_lc"] = str(m["Overall Status"]).lower()
+        m["_is_closed"] = is_closed(m)
+        m["_month"] = month_key(m["Date Received"] or "")
+        m["_dl_int"] = to_int(m["Days with Legal"], 0)
+        m["_tt_int"] = to_int(m["Total Cycle Time"], 0)
+        m["_sh_int"] = max(m["_tt_int"] - m["_dl_int"], 0)  # days with stakeholder
+
+def _load_matters_raw():
+    """matters.json exactly as stored (no normalization, no journal, never writes).
+
+    Parsed straight from a read-only mmap of the file, so a big snapshot is not
+    first copied into a bytes object; pages come from the shared OS page cache.
+    """
+    try:
+        f = open(MATTERS_PATH, "rb")
+    except FileNotFoundError:
+        return []
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _json_loads(b"")  # can't mmap an empty file; fail as load_json would
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+            return _json_loads(buf)
+
+def _replay_journal(data):
+    """Apply matters.log (one JSON record per line) on top of the normalized snapshot, in place.
+
+    Records are {"op": "upsert", "row": {...}} or {"op": "delete", "id": ...}.
+    Applied by position, like the routes that wrote them: an upsert replaces
+    the first row with that id (new ids go to the end), a delete drops every
+    row with it; other rows sharing an id are left alone. A torn last line
+    from an interrupted append is skipped and cut off the file, so the next
+    append starts on a line of its own.
+    """
+    try:
+        f = open(MATTERS_LOG_PATH, "r+b")
+    except PermissionError:
+        f = open(MATTERS_LOG_PATH, "rb")  # read-only data dir: replay, don't repair
+    except FileNotFoundError:
+        return
+    with f:
+        raw = f.read()
+        if raw and not raw.endswith(b"\n"):
+            size = len(raw)
+            raw = raw[:raw.rfind(b"\n") + 1]
+            if f.writable():
+                with _matters_lock():
+                    # only if nobody appended since we read it
+                    if os.fstat(f.fileno()).st_size == size:
+                        f.truncate(len(raw))
+    lines = raw.splitlines()
+    if not lines:
+        return
+
+    positions = defaultdict(list)  # id -> indices into data, in order
+    for i, m in enumerate(data):
+        positions[m["id"]].append(i)
+    dropped = False
+    for line in lines:
+        try:
+            rec = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        if rec.get("op") == "upsert":
+            row = rec["row"]
+            _normalize_matters([row], stored=True)
+            at = positions[row["id"]]
+            if at:
+                data[at[0]] = row
+            else:
+                at.append(len(data))
+                data.append(row)
+        elif rec.get("op") == "delete":
+            for i in positions.pop(rec.get("id"), ()):
+                data[i] = None
+                dropped = True
+    if dropped:
+        data[:] = [m for m in data if m is not None]
+
+def _read_matters():
+    """Snapshot + journal straight from disk, normalized (bypasses the cache)."""
+    data = _load_matters_raw()
+    _normalize_matters(data, stored=True)
+    _replay_journal(data)
     return data
 
+def _load_matters():
+    """(tag, rows) for the current matters; `tag` is the version the rows were read at."""
+    # stat *before* reading: if the files change mid-read the stored tag is
+    # older than the data, so the next call just re-reads
+    tag = _matters_tag()
+    if tag is not None and tag == _MATTERS_CACHE["tag"]:
+        return tag, _MATTERS_CACHE["data"]
 
+    data = _read_matters()
+    _MATTERS_CACHE.update(tag=tag, data=data)
+    return tag, data
+
+def get_matters():
+    return _load_matters()[1]
+
+def strip_derived(m: dict) -> dict:
+    """Copy of a matter without the in-memory `_`-prefixed helper keys (never persisted)."""
+    return {k: v for k, v in m.items() if not k.startswith("_")}
+
+def _remember_matters(matters, tag):
+    # Serve what was just persisted from memory. `tag` must describe exactly
+    # these rows (taken from our own write, never a fresh stat that could pick
+    # up another worker's change); None means "unknown", so the next read
+    # goes back to disk.
+    _MATTERS_CACHE.update(tag=tag, data=matters)
+    # results derived from the old list are dead weight now
+    _AGG_CACHE.clear()
+    # drop the per-request copy so later reads in this request see the new data
+    g.pop("matters", None)
+    g.pop("matters_tag", None)
+
+_MATTERS_LOCK_HELD = threading.local()
+
+@contextlib.contextmanager
+def _matters_lock():
+    """Exclusive lock (across workers and threads) for anything that writes matters.
+
+    Readers don't take it: the snapshot is swapped in atomically and the
+    journal only grows, so they always see a consistent pair. Re-entrant per
+    thread (compaction replays the journal, which may repair its tail).
+    """
+    if getattr(_MATTERS_LOCK_HELD, "value", False):
+        yield
+        return
+    os.makedirs(DATA_DIR, exist_ok=True)
+    with open(MATTERS_LOCK_PATH, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after ~10s; keep waiting
+                    pass
+        _MATTERS_LOCK_HELD.value = True
+        try:
+            yield
+        finally:
+            _MATTERS_LOCK_HELD.value = False
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _write_snapshot(matters):
+    # caller holds _matters_lock(); returns the stat of the file written
+    _normalize_matters(matters)
+    return save_json(MATTERS_PATH, [strip_derived(m) for m in matters])
 
 def write_matters(matters):
-    save_json(MATTERS_PATH, matters)
+    """Replace every matter: rewrite matters.json with `matters` and discard the journal."""
+    replaced_log = MATTERS_LOG_PATH + ".replaced"
+    with _matters_lock():
+        # Set the journal aside *before* the swap: its records describe the
+        # old list and must never replay over this one (if we crash mid-way,
+        # the .replaced file is only left for manual recovery).
+        try:
+            os.replace(MATTERS_LOG_PATH, replaced_log)
+        except FileNotFoundError:
+            pass
+        st = _write_snapshot(matters)
+        try:
+            os.remove(replaced_log)
+        except FileNotFoundError:
+            pass
+    _remember_matters(matters, ((st.st_mtime_ns, st.st_size), None))
+
+def _compact():
+    """Fold the journal into matters.json; caller holds _matters_lock(). Returns (rows, tag)."""
+    # rebuilt from disk under the lock, so every acknowledged append is in it
+    matters = _read_matters()
+    st = _write_snapshot(matters)
+    # the snapshot now holds every journal record, so a crash before this
+    # remove just replays them to the same rows
+    try:
+        os.remove(MATTERS_LOG_PATH)
+    except FileNotFoundError:
+        pass
+    return matters, ((st.st_mtime_ns, st.st_size), None)
+
+def _journal_append(record, base):
+    """Append one record to matters.log (O_APPEND + fsync): O(row) per edit, not O(N).
 
-def distinct_values(matters, field):
-    vals = sorted({(m.get(field) or "").strip() for m in matters if (m.get(field) or "").strip()})
-    return vals
+    Caller holds _matters_lock().
+
+    Returns the tag of the files afterwards if they provably hold exactly
+    `base` (the tag the caller's rows were read at) plus this record, i.e. no
+    other worker wrote in between; otherwise None.
+    """
+    line = orjson.dumps(record) + b"\n"
+    os.makedirs(DATA_DIR, exist_ok=True)
+    # O_BINARY (Windows only): no "\n" -> "\r\n" translation
+    flags = os.O_RDWR | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+    fd = os.open(MATTERS_LOG_PATH, flags, 0o644)
+    try:
+        # a torn tail from an interrupted append must not swallow this record:
+        # start on a fresh line (replay skips the lone fragment). lseek+read
+        # rather than os.pread, which Windows lacks; O_APPEND still writes at the end.
+        if os.fstat(fd).st_size:
+            os.lseek(fd, -1, os.SEEK_END)
+            if os.read(fd, 1) != b"\n":
+                line = b"\n" + line
+        os.write(fd, line)
+        os.fsync(fd)
+        st = os.fstat(fd)
+    finally:
+        os.close(fd)
+
+    if base is None or base[0] is None or _stat_tag(MATTERS_PATH) != base[0]:
+        return None  # no snapshot to build on, or it was rewritten meanwhile
+    try:
+        if os.stat(MATTERS_LOG_PATH).st_ino != st.st_ino:
+            return None  # journal compacted away under us
+    except FileNotFoundError:
+        return None
+    if st.st_size != (base[1][1] if base[1] else 0) + len(line):
+        return None  # someone else appended before/after us
+    return (base[0], (st.st_mtime_ns, st.st_size))
+
+def _journal_or_compact(matters, record, base):
+    with _matters_lock():
+        tag = _journal_append(record, base)
+        # Once the journal outgrows the snapshot, replaying it costs more than
+        # a rewrite would; fold it back into matters.json.
+        snap, log = _stat_tag(MATTERS_PATH), _stat_tag(MATTERS_LOG_PATH)
+        if snap is None or (log is not None and log[1] > snap[1]):
+            matters, tag = _compact()
+    _remember_matters(matters, tag)
+
+def get_matters_cached():
+    """get_matters() memoized on flask.g for the lifetime of the current request."""
+    if "matters" not in g:
+        g.matters_tag, g.matters = _load_matters()
+    return g.matters
+
+def _index_by_id(rows):
+    # first row wins for a repeated id, as the old next(...) lookups did
+    index = {}
+    for r in rows:
+        index.setdefault(r["id"], r)
+    return index
+
+def matters_by_id():
+    """id -> matter index over exactly the rows get_matters_cached() returns this request.
+
+    The rows are the shared cached objects: copy one before changing it and
+    hand the copy to save_matter().
+    """
+    return _cached("matters_by_id", _index_by_id, get_matters_cached())
+
+# Derived results (dashboard stats, filter options, indexes) memoized per
+# matters list, so repeat page loads skip the aggregation until the data
+# changes. Entries are keyed on the identity of the list they were built from
+# (never on a fresh stat), so positions/rows in a result always belong to the
+# list the caller holds.
+_AGG_CACHE = {}
+
+def _cached(key, fn, matters, *args):
+    """Return fn(matters, *args), reusing the last result for `key` built from this same list."""
+    hit = _AGG_CACHE.get(key)
+    if hit is not None and hit[0] is matters:
+        return hit[1]
+    value = fn(matters, *args)
+    _AGG_CACHE[key] = (matters, value)
+    return value
+
+def save_matter(matter):
+    """Insert or replace a single matter (matched on id) and persist.
+
+    Routes that change one row go through here / delete_matter() rather than
+    rewriting the list themselves, so the storage write path lives in one place.
+    The change is appended to matters.log; matters.json is only rewritten when
+    the journal gets compacted. A loaded list is never mutated: the new
+    version is a fresh list, so nothing cached against the old one can leak
+    into it. Pass a new dict (e.g. a copy of the cached row), never a cached
+    row edited in place: a failed write must leave the cache untouched.
+    """
+    _normalize_matters([matter])
+    current = matters_by_id().get(matter["id"])
+    rows = list(get_matters_cached())
+    if current is None:
+        rows.append(matter)
+    else:
+        # index and list come from the same load, so `current` is in `rows`
+        rows[next(i for i, m in enumerate(rows) if m is current)] = matter
+    _journal_or_compact(rows, {"op": "upsert", "row": strip_derived(matter)}, g.matters_tag)
+
+def delete_matter(mid):
+    """Remove a single matter by id and persist. Returns True if a row was removed."""
+    current = matters_by_id().get(mid)
+    if current is None:
+        return False
+    rows = [m for m in get_matters_cached() if m["id"] != mid]  # every row with that id
+    _journal_or_compact(rows, {"op": "delete", "id": mid}, g.matters_tag)
+    return True
+
+def distinct_values_multi(matters, fields):
+    """Distinct values of several fields in one pass: {field: sorted non-empty stripped values}."""
+    acc = {f: set() for f in fields}
+    for m in matters:
+        for f in fields:
+            v = (m.get(f) or "").strip()
+            if v:
+                acc[f].add(v)
+    return {f: sorted(vals) for f, vals in acc.items()}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+def build_search_index(matters):
+    """Inverted index over _search_blob: token -> set of row positions in `matters`."""
+    index = defaultdict(set)
+    for pos, m in enumerate(matters):
+        for tok in set(_TOKEN_RE.findall(m["_search_blob"])):
+            index[tok].add(pos)
+    return dict(index)
+
+def search_positions(matters, q):
+    """
+    Positions of rows whose _search_blob contains q (plain substring match).
+    Candidates come from the cached inverted index: every alphanumeric run of q
+    must sit inside some indexed token of a matching row, so only rows hit by
+    all of q's tokens are checked. Queries with no alphanumerics fall back to a scan.
+    """
+    tokens = set(_TOKEN_RE.findall(q))
+    if not tokens:
+        return {i for i, m in enumerate(matters) if q in m["_search_blob"]}
+
+    index = _cached("search_index", build_search_index, matters)
+    candidates = None
+    for t in tokens:
+        hits = set().union(*(rows for word, rows in index.items() if t in word))
+        candidates = hits if candidates is None else candidates & hits
+        if not candidates:
+            return set()
+    return {i for i in candidates if q in matters[i]["_search_blob"]}
+
+def build_filter_buckets(matters, fields):
+    """field -> {stripped lowercase value -> set of row positions}, for exact-match filters."""
+    buckets = {f: defaultdict(set) for f in fields}
+    for pos, m in enumerate(matters):
+        for f in fields:
+            v = (m.get(f) or "").strip().lower()
+            if v:
+                buckets[f][v].add(pos)
+    return {f: dict(b) for f, b in buckets.items()}
 
 def get_users():
     data = load_json(USERS_PATH)
@@ -284,23 +698,21 @@ def find_matter_by_ref(ref: str):
     if not ref:
         return None
     ref_norm = ref.strip().lower()
-    for m in get_matters():
+    for m in get_matters_cached():
         if (m.get("Ref") or "").strip().lower() == ref_norm:
             return m
     return None
 
 
 
-from collections import defaultdict, Counter
-
 def month_key(date_str):
     # Expects YYYY-MM-DD; returns 'YYYY-MM'
     try:
         return date_str[:7]
     except Exception:
         return ""
-    
-import re
+
+import numpy as np
 
 def to_int(val, default=0):
     """Parse integers safely from Excel-imported values (handles '', 'N/A', '12.0', '1,234')."""
@@ -317,246 +729,215 @@ def to_int(val, default=0):
     except Exception:
         return default
 
+# "closed" synonyms as one alternation; "done" only counts as the whole status
+_CLOSED_RE = re.compile(r"close|complete|executed|signed|^done$")
+
 def is_closed(m):
     """Treat common ‘closed’ synonyms as closed."""
-    s = str(m.get("Overall Status", "") or "").strip().lower()
-    # exact/contains match for common variations
-    return (
-        s == "closed"
-        or "close" in s
-        or "complete" in s
-        or "executed" in s
-        or "signed" in s
-        or s == "done"
-    )
+    return _CLOSED_RE.search(str(m.get("Overall Status", "") or "").strip().lower()) is not None
 
 from datetime import date
 
+_ISO_RE = re.compile(r"[0-9]{4}-?[0-9]{2}-?[0-9]{2}")  # extended or basic (20240101) form
+
 def compute_cycle_days(date_received_iso: str, date_closed_iso: str) -> int:
     """Return calendar day difference (>=0) between ISO dates YYYY-MM-DD."""
+    if not date_received_iso or not date_closed_iso:
+        return 0
+    # str() as before: API rows may carry numbers (20240101 is valid ISO basic)
+    d1, d2 = str(date_received_iso), str(date_closed_iso)
+    # shape check up front, so free text returns without raising
+    if not (_ISO_RE.fullmatch(d1) and _ISO_RE.fullmatch(d2)):
+        return 0
     try:
-        if not date_received_iso or not date_closed_iso:
-            return 0
-        d1 = datetime.date.fromisoformat(str(date_received_iso))
-        d2 = datetime.date.fromisoformat(str(date_closed_iso))
-        delta = (d2 - d1).days
-        return max(delta, 0)
-    except Exception:
+        d1 = datetime.date.fromisoformat(d1)
+        d2 = datetime.date.fromisoformat(d2)
+    except ValueError:  # right shape, impossible date (e.g. 2024-02-30)
         return 0
+    return max((d2 - d1).days, 0)
 
 
 
-def compute_open_by_stage(matters):
-    open_matters = [m for m in matters if str(m.get("Overall Status","")).lower() == "open"]
-    counts = Counter((m.get("Stage") or "Unspecified") for m in open_matters)
-    labels = list(counts.keys())
-    values = [counts[k] for k in labels]
-    return labels, values
-
-def compute_legal_vs_stakeholder_avgs(matters):
-    open_matters = [m for m in matters if str(m.get("Overall Status","")).lower() == "open"]
-    if not open_matters:
-        return 0, 0
-    legal_days = 0
-    stakeholder_days = 0
-    for m in open_matters:
-        dl = to_int(m.get("Days with Legal"), 0)
-        tt = to_int(m.get("Total Cycle Time"), 0)
-        legal_days += dl
-        stakeholder_days += max(tt - dl, 0)
-    n = len(open_matters)
-    return round(legal_days / n, 2), round(stakeholder_days / n, 2)
-
-
-def compute_monthly_counts(matters):
-    """
-    Monthly counts keyed by the *Date Received* month.
-    - New Contracts: count of matters received that month.
-    - Closed Contracts: count of matters whose status indicates closed (see is_closed),
-      bucketed in the *same receipt month*.
-    - Rolling Open: cumulative (new - closed).
-    """
-    by_month_new = Counter()
-    by_month_closed = Counter()
-
-    for m in matters:
-        mk = month_key(m.get("Date Received", "") or "")
-        if not mk:
-            continue
-        by_month_new[mk] += 1
-        if is_closed(m):
-            by_month_closed[mk] += 1
+_LEGAL_RE = re.compile(r"received|review|draft|comments|legal")
 
-    months = sorted(set(by_month_new.keys()) | set(by_month_closed.keys()))
-    new_vals = [by_month_new.get(m, 0) for m in months]
-    closed_vals = [by_month_closed.get(m, 0) for m in months]
+def stage_bucket(stage):
+    if stage and _LEGAL_RE.search(stage.lower()):
+        return "Legal"
+    # Everything else -> Stakeholder/Other
+    return "Stakeholder/Other"
 
-    rolling = []
-    running = 0
-    for m in months:
-        running += by_month_new.get(m, 0) - by_month_closed.get(m, 0)
-        rolling.append(running)
+def _month_columns(slot, idx, dl, tt, closed):
+    """Pack per-row lists into the (months, month_idx, dl, tt, closed) arrays the kernel takes."""
+    months = sorted(slot)
+    # remap first-seen slots to sorted month positions
+    rank = np.empty(len(months), dtype=np.intp)
+    for pos, mk in enumerate(months):
+        rank[slot[mk]] = pos
+    month_idx = rank[np.asarray(idx, dtype=np.intp)]
+    return (
+        months,
+        month_idx,
+        np.asarray(dl, dtype=np.int64),
+        np.asarray(tt, dtype=np.int64),
+        np.asarray(closed, dtype=np.int64),
+    )
 
-    return months, new_vals, closed_vals, rolling
 
+def _monthly_kernel(month_idx, dl, tt, closed, n_months):
+    """Per-month (new, closed, dl_sum, sh_sum, tt_sum) via np.bincount (typed C loops)."""
+    sh = np.maximum(tt - dl, 0)
+    def per_month(weights=None):
+        return np.bincount(month_idx, weights=weights, minlength=n_months).astype(np.int64)
+    return per_month(), per_month(closed), per_month(dl), per_month(sh), per_month(tt)
 
 
-def compute_monthly_cycle_time_avgs(matters):
+def _monthly_avgs(new, dl_sum, sh_sum, tt_sum):
+    """Per-month sums -> rounded averages; every month has at least one row, so n > 0."""
+    avg_dl, avg_sh, avg_tt = [], [], []
+    for n, d, sh, t in zip(new.tolist(), dl_sum.tolist(), sh_sum.tolist(), tt_sum.tolist()):
+        avg_dl.append(round(d / n, 2))
+        avg_sh.append(round(sh / n, 2))
+        avg_tt.append(round(t / n, 2))
+    return avg_dl, avg_sh, avg_tt
+
+
+DashboardStats = namedtuple("DashboardStats", [
+    "total", "open_count", "closed_count", "stages",
+    "open_by_stage_labels", "open_by_stage_values",
+    "avg_legal", "avg_stakeholder",
+    "months_counts", "new_vals", "closed_vals", "rolling_vals",
+    "months_cycle", "avg_dl_vals", "avg_sh_vals", "avg_tt_vals",
+    "owner_rows",
+])
+
+def compute_dashboard(matters):
     """
-    Group by Date Received month and average:
-    - Avg. Time w/Legal
-    - Avg. Time w/Stakeholder (= Total Cycle Time - Days with Legal, clamped at 0)
-    - Avg. Total Cycle Time
+    Every dashboard aggregate in one pass over matters: counts, stage tallies,
+    open-matter averages, owner table and the per-month series.
+    Expects rows from get_matters() (uses the derived `_` keys set on load).
+
+    Monthly series are keyed by the *Date Received* month:
+    - new / closed counts (closed per is_closed, in the same receipt month),
+      rolling open = cumulative (new - closed)
+    - avg days with Legal, with Stakeholder (= Total Cycle Time - Days with
+      Legal, clamped at 0) and total cycle time
     """
-    buckets = defaultdict(list)  # month -> list of (dl, sh, tt)
-    for m in matters:
-        mk = month_key(m.get("Date Received", "") or "")
-        if not mk:
-            continue
-        dl = to_int(m.get("Days with Legal"), 0)
-        tt = to_int(m.get("Total Cycle Time"), 0)
-        sh = max(tt - dl, 0)
-        buckets[mk].append((dl, sh, tt))
-
-    months = sorted(buckets.keys())
-    avg_dl, avg_sh, avg_tt = [], [], []
-
-    for mk in months:
-        rows = buckets[mk]
-        if rows:
-            n = len(rows)
-            dl = sum(r[0] for r in rows) / n
-            sh = sum(r[1] for r in rows) / n
-            tt = sum(r[2] for r in rows) / n
-        else:
-            dl = sh = tt = 0
-        avg_dl.append(round(dl, 2))
-        avg_sh.append(round(sh, 2))
-        avg_tt.append(round(tt, 2))
-
-    return months, avg_dl, avg_sh, avg_tt
-
-
-def stage_bucket(stage):
-    s = (stage or "").lower()
-    legal_stages = ["received", "review", "draft", "comments", "legal"]
-    if any(k in s for k in legal_stages):
-        return "Legal"
-    # Everything else -> Stakeholder/Other
-    return "Stakeholder/Other"
-
-def compute_owner_table(matters):
-    open_matters = [m for m in matters if str(m.get("Overall Status","")).lower() == "open"]
+    open_count = closed_count = 0
+    stages = Counter()
+    open_stages = Counter()
+    legal_sum = stakeholder_sum = 0
     owners = defaultdict(lambda: {"total":0, "with_legal":0, "with_others":0})
-    for m in open_matters:
-        owner = (m.get("Owner") or m.get("Legal") or "Unassigned").strip() or "Unassigned"
-        owners[owner]["total"] += 1
-        if stage_bucket(m.get("Stage","")) == "Legal":
-            owners[owner]["with_legal"] += 1
-        else:
-            owners[owner]["with_others"] += 1
-    # Convert to sorted list of tuples
-    rows = []
-    for name, data in owners.items():
-        rows.append({"owner": name, **data})
-    rows.sort(key=lambda r: (-r["total"], r["owner"].lower()))
-    return rows
+    slot = {}
+    idx, dl_col, tt_col, closed_col = [], [], [], []
+
+    for m in matters:
+        stage = m["Stage"]
+        dl = m["_dl_int"]
+        tt = m["_tt_int"]
+        closed = m["_is_closed"]
+        closed_count += closed
+        stages[stage or "Unspecified"] += 1
+
+        if m["_status_lc"] == "open":
+            open_count += 1
+            open_stages[stage or "Unspecified"] += 1
+            legal_sum += dl
+            stakeholder_sum += m["_sh_int"]
+            owner = (m.get("Owner") or m.get("Legal") or "Unassigned").strip() or "Unassigned"
+            owners[owner]["total"] += 1
+            if stage_bucket(stage) == "Legal":
+                owners[owner]["with_legal"] += 1
+            else:
+                owners[owner]["with_others"] += 1
+
+        mk = m["_month"]
+        if mk:
+            idx.append(slot.setdefault(mk, len(slot)))
+            dl_col.append(dl)
+            tt_col.append(tt)
+            closed_col.append(closed)
+
+    months, month_idx, dl_arr, tt_arr, closed_arr = _month_columns(slot, idx, dl_col, tt_col, closed_col)
+    new, closed_c, dl_sum, sh_sum, tt_sum = _monthly_kernel(month_idx, dl_arr, tt_arr, closed_arr, len(months))
+    avg_dl_vals, avg_sh_vals, avg_tt_vals = _monthly_avgs(new, dl_sum, sh_sum, tt_sum)
+
+    owner_rows = [{"owner": name, **data} for name, data in owners.items()]
+    owner_rows.sort(key=lambda r: (-r["total"], r["owner"].lower()))
+
+    return DashboardStats(
+        total=len(matters),
+        open_count=open_count,
+        closed_count=closed_count,
+        stages=stages,
+        open_by_stage_labels=list(open_stages.keys()),
+        open_by_stage_values=list(open_stages.values()),
+        avg_legal=round(legal_sum / open_count, 2) if open_count else 0,
+        avg_stakeholder=round(stakeholder_sum / open_count, 2) if open_count else 0,
+        months_counts=months,
+        new_vals=new.tolist(),
+        closed_vals=closed_c.tolist(),
+        rolling_vals=np.cumsum(new - closed_c).tolist(),
+        months_cycle=months,
+        avg_dl_vals=avg_dl_vals,
+        avg_sh_vals=avg_sh_vals,
+        avg_tt_vals=avg_tt_vals,
+        owner_rows=owner_rows,
+    )
 
 
+def _newest_first(matters):
+    return sorted(matters, key=lambda m: m.get("Date Received", ""), reverse=True)
 
 @app.route("/")
 def dashboard():
-    matters = get_matters()
-    total = len(matters)
-    open_count = sum(1 for m in matters if str(m.get("Overall Status","")).lower() == "open")
-    closed_count = sum(1 for m in matters if is_closed(m))
-    stages = {}
-    for m in matters:
-        s = m.get("Stage","") or "Unspecified"
-        stages[s] = stages.get(s, 0) + 1
-
-    # Charts
-    open_by_stage_labels, open_by_stage_values = compute_open_by_stage(matters)
-    avg_legal, avg_stakeholder = compute_legal_vs_stakeholder_avgs(matters)
-    months_counts, new_vals, closed_vals, rolling_vals = compute_monthly_counts(matters)
-    months_cycle, avg_dl_vals, avg_sh_vals, avg_tt_vals = compute_monthly_cycle_time_avgs(matters)
-    owner_rows = compute_owner_table(matters)
+    matters = get_matters_cached()
+    # Stats + charts in a single pass
+    stats = _cached("dashboard", compute_dashboard, matters)
 
     # --- Recent Matters toggle (default: hide closed) ---
     show_closed = request.args.get("show_closed") == "1"
 
-    # sort newest first (by Date Received ISO string)
-    recent_matters = sorted(matters, key=lambda m: m.get("Date Received", ""), reverse=True)
+    # newest first (by Date Received ISO string); the sort is cached per
+    # matters version, so a request only walks it until it has 5 rows
+    recent_matters = _cached("recent_sorted", _newest_first, matters)
 
     def _is_closed(m):
         return str(m.get("Overall Status", "")).strip().lower() == "closed"
 
     if not show_closed:
-        recent_matters = [m for m in recent_matters if not _is_closed(m)]
+        recent_matters = (m for m in recent_matters if not _is_closed(m))
 
-    recent_matters = recent_matters[:5]
+    recent_matters = list(itertools.islice(recent_matters, 5))
 
     return render_template(
         "dashboard.html",
-        total=total,
-        open_count=open_count,
-        closed_count=closed_count,
-        stages=stages,
         matters=recent_matters,            # <-- pass filtered list
         show_closed=show_closed,           # <-- pass toggle state to template
-        open_by_stage_labels=open_by_stage_labels,
-        open_by_stage_values=open_by_stage_values,
-        avg_legal=avg_legal,
-        avg_stakeholder=avg_stakeholder,
-        months_counts=months_counts,
-        new_vals=new_vals,
-        closed_vals=closed_vals,
-        rolling_vals=rolling_vals,
-        months_cycle=months_cycle,
-        avg_dl_vals=avg_dl_vals,
-        avg_sh_vals=avg_sh_vals,
-        avg_tt_vals=avg_tt_vals,
-        owner_rows=owner_rows,
+        **stats._asdict(),
     )
 
 @app.route("/matters")
 @login_required
 def matters_list():
-    matters = get_matters()
-
-    # Text search
-    q = request.args.get("q","").strip().lower()
-    if q:
-        matters = [m for m in matters if q in json.dumps(m).lower()]
-
-    # Filterable fields
-    FILTER_FIELDS = [
-        "Group Entity","Counterparty","Branch","Legal","Internal Dept",
-        "Contract Type","Internal Stakeholder","Who With","Stage","Overall Status"
-    ]
+    matters = get_matters_cached()
 
-    # Build distinct options
-    filter_options = {f: distinct_values(get_matters(), f) for f in FILTER_FIELDS}
+    # Build distinct options (computed once per matters.json version)
+    filter_options = _cached("filter_options", distinct_values_multi, matters, FILTER_FIELDS)
 
     # Capture current selections
+    q = request.args.get("q","").strip().lower()
     active = {f: (request.args.get(f.replace(' ', '_')) or "").strip() for f in FILTER_FIELDS}
 
-    # Apply filters
-    def match_field(mval, selected):
-        if not selected:
-            return True
-        return (mval or "").strip().lower() == selected.strip().lower()
+    # Text search and filters each narrow a set of row positions; None = no constraint yet
+    keep = search_positions(matters, q) if q else None
+    if any(active.values()):
+        buckets = _cached("filter_buckets", build_filter_buckets, matters, FILTER_FIELDS)
+        for f, sel in active.items():
+            if sel:
+                hits = buckets[f].get(sel.lower(), set())
+                keep = hits if keep is None else keep & hits
 
-    filtered = []
-    for m in matters:
-        ok = True
-        for f in FILTER_FIELDS:
-            sel = active[f]
-            if not match_field(m.get(f, ""), sel):
-                ok = False
-                break
-        if ok:
-            filtered.append(m)
+    filtered = matters if keep is None else [matters[i] for i in sorted(keep)]
 
     return render_template("matters_list.html",
                            matters=filtered, q=q,
@@ -571,7 +952,6 @@ def matters_new():
     
     users = get_users()
     if request.method == "POST":
-        audit_log("create", data["id"], before={}, after=data, fields_changed=list(FIELDS))
         data = {f: request.form.get(f, "").strip() for f in FIELDS}
         data["Date Received"] = normalize_date(data.get("Date Received"))
         try:
@@ -583,10 +963,9 @@ def matters_new():
         except ValueError:
             data["Total Cycle Time"] = 0
 
-        matters = get_matters()
         data["id"] = new_id()
-        matters.append(data)
-        write_matters(matters)
+        save_matter(data)
+        audit_log("create", data["id"], before={}, after=data, fields_changed=list(FIELDS))
         flash("Matter created", "success")
         return redirect(url_for("matters_list"))
     return render_template("matters_form.html", matter=None, fields=FIELDS, users=users, allowed_statuses=ALLOWED_STATUSES)
@@ -596,12 +975,11 @@ def matters_new():
 @app.route("/matters/<mid>/close", methods=["POST"])
 @login_required
 def matters_close(mid):
-    matters = get_matters()
-    audit_log("close", m["id"], before={}, after=m, fields_changed=["Overall Status","Date Closed","Total Cycle Time"])
-    m = next((x for x in matters if x["id"] == mid), None)
+    m = matters_by_id().get(mid)
     if not m:
         flash("Matter not found", "danger")
         return redirect(url_for("matters_list"))
+    m = dict(m)  # edit a copy: the cached row is shared until the save succeeds
 
     # Set closed fields
     today_iso = date.today().isoformat()
@@ -614,7 +992,8 @@ def matters_close(mid):
     # Recalculate cycle time
     m["Total Cycle Time"] = compute_cycle_days(m.get("Date Received", ""), today_iso)
 
-    write_matters(matters)
+    save_matter(m)
+    audit_log("close", m["id"], before={}, after=m, fields_changed=["Overall Status","Date Closed","Total Cycle Time"])
     flash("Case closed.", "success")
     return redirect(url_for("matters_edit", mid=mid))
     
@@ -627,15 +1006,15 @@ def matters_close(mid):
 @login_required
 def matters_edit(mid):
     users = get_users()
-    matters = get_matters()
-    matter = next((m for m in matters if m["id"] == mid), None)
+    matter = matters_by_id().get(mid)
     if not matter:
         flash("Matter not found", "danger")
         return redirect(url_for("matters_list"))
 
     if request.method == "POST":
-        # snapshot BEFORE
+        # snapshot BEFORE; edit a copy, the cached row is shared until the save succeeds
         before = dict(matter)
+        matter = dict(matter)
 
         # apply updates from form
         for f in FIELDS:
@@ -655,7 +1034,7 @@ def matters_edit(mid):
                 matter.get("Date Received", ""), matter.get("Date Closed", "")
             )
 
-        write_matters(matters)
+        save_matter(matter)
 
         # snapshot AFTER and log audit
         after = dict(matter)
@@ -685,79 +1064,58 @@ def matters_edit(mid):
 @app.route("/matters/<mid>/delete", methods=["POST"])
 @login_required
 def matters_delete(mid):
-    matters = get_matters()
-    matters = [m for m in matters if m["id"] != mid]
-    write_matters(matters)
+    delete_matter(mid)
     flash("Matter deleted", "info")
     return redirect(url_for("matters_list"))
 
 @app.route("/export/json")
 @login_required
 def export_json():
-    return send_file(MATTERS_PATH, as_attachment=True, download_name="matters.json")
+    # Serialize the already-loaded list rather than re-reading matters.json
+    data = orjson.dumps([strip_derived(m) for m in get_matters_cached()])
+    return send_file(io.BytesIO(data), mimetype="application/json",
+                     as_attachment=True, download_name="matters.json")
 
 @app.route("/export/pdf")
 @login_required
 def export_pdf():
-    # Simple landscape A4 PDF listing matters in a table-like layout
-    matters = get_matters()
-    pdf_path = os.path.join(DATA_DIR, "matters_export.pdf")
-    c = canvas.Canvas(pdf_path, pagesize=landscape(A4))
-    width, height = landscape(A4)
+    # Lazy import (clear error if reportlab missing)
+    try:
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.lib.units import mm
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    except Exception:
+        flash("PDF export requires reportlab. Run: pip install reportlab", "danger")
+        return redirect(url_for("matters_list"))
 
+    # Simple landscape A4 PDF listing matters in a table; platypus handles
+    # pagination and repeats the header row on every page
+    # rendered straight into memory; nothing is written under DATA_DIR
+    matters = get_matters_cached()
+    bio = io.BytesIO()
     margin = 10 * mm
-    x = margin
-    y = height - margin
-
-    title = "Matters Export"
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(x, y, title)
-    y -= 10 * mm
+    doc = SimpleDocTemplate(
+        bio, pagesize=landscape(A4),
+        leftMargin=margin, rightMargin=margin, topMargin=margin, bottomMargin=margin,
+    )
 
     headers = ["Ref", "Date Received", "Group Entity", "Counterparty", "Stage", "Overall Status", "Owner"]
-    c.setFont("Helvetica-Bold", 9)
     col_widths = [70*mm, 25*mm, 40*mm, 40*mm, 40*mm, 25*mm, 25*mm]
+    data = [headers] + [[str(m.get(h, ""))[:120] for h in headers] for m in matters]
 
-    # Header row
-    cx = x
-    for h, w in zip(headers, col_widths):
-        c.drawString(cx, y, h)
-        cx += w
-    y -= 6 * mm
-    c.setFont("Helvetica", 8)
+    table = Table(data, colWidths=col_widths, repeatRows=1)
+    table.setStyle(TableStyle([
+        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 9),
+        ("FONT", (0, 1), (-1, -1), "Helvetica", 8),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]))
 
-    for m in matters:
-        cx = x
-        row = [
-            m.get("Ref",""),
-            m.get("Date Received",""),
-            m.get("Group Entity",""),
-            m.get("Counterparty",""),
-            m.get("Stage",""),
-            m.get("Overall Status",""),
-            m.get("Owner",""),
-        ]
-        line_height = 5 * mm
-        # Wrap long text crudely
-        for cell, w in zip(row, col_widths):
-            text = str(cell)[:120]
-            c.drawString(cx, y, text)
-            cx += w
-        y -= line_height
-        if y < margin + 20*mm:
-            c.showPage()
-            y = height - margin
-            c.setFont("Helvetica-Bold", 9)
-            cx = x
-            for h, w in zip(headers, col_widths):
-                c.drawString(cx, y, h)
-                cx += w
-            y -= 6 * mm
-            c.setFont("Helvetica", 8)
-
-    c.showPage()
-    c.save()
-    return send_file(pdf_path, as_attachment=True, download_name="matters_export.pdf")
+    title = Paragraph("Matters Export", getSampleStyleSheet()["Heading1"])
+    doc.build([title, Spacer(1, 4 * mm), table])
+    bio.seek(0)
+    return send_file(bio, mimetype="application/pdf",
+                     as_attachment=True, download_name="matters_export.pdf")
 
 @app.route("/audit/purge", methods=["POST"])
 @login_required
@@ -862,7 +1220,7 @@ def audit_import():
         if not ref:
             return None
         ref_norm = ref.strip().lower()
-        for m in get_matters():
+        for m in get_matters_cached():
             if (m.get("Ref") or "").strip().lower() == ref_norm:
                 return m
         return None
@@ -939,15 +1297,17 @@ def audit_import():
 def api_matters():
     if request.method == "POST":
         data = request.json or {}
-        matters = get_matters()
-        data.setdefault("id", new_id())
-        matters.append(data)
-        write_matters(matters)
+        # create-only, like the original append: never let a posted id
+        # replace an existing matter
+        if not data.get("id") or data["id"] in matters_by_id():
+            data["id"] = new_id()
+        save_matter(data)
         return jsonify({"ok": True, "id": data["id"]})
-    return jsonify(get_matters())
+    # orjson straight to bytes: no key sorting / indent pass over every matter
+    payload = orjson.dumps([strip_derived(m) for m in get_matters_cached()])
+    return app.response_class(payload, mimetype="application/json")
 
 from werkzeug.utils import secure_filename
-import re
 
 ALLOWED_EXTS = {'.xlsx', '.xlsm'}
 
@@ -974,34 +1334,27 @@ HEADER_ALIASES = {
     "Days with Legal": ["Days with Legal", "Days_with_Legal", "Days With Legal"],
     "Total Cycle Time": ["Total Cycle Time", "Total_Cycle_Time", "Cycle Time"],
     "Owner": ["Owner", "Matter Owner", "Assigned To", "Assignee", "Legal"],
-    "Date Received": ["Date Received", "Date"],
-    "Group Entity":  ["Group Entity", "Group"],
-    "Overall Status": ["Overall Status", "Status"],
 }
 
+_SQUASH_RE = re.compile(r"[^a-z0-9]+")
+
+@functools.lru_cache(maxsize=256)
+def _squash(s):
+    # fuzzy header key: lowercase with non-alphanumerics removed (memoized:
+    # uploads repeat the same handful of header names)
+    return _SQUASH_RE.sub("", str(s).lower())
+
+# Alias lookup built once, keyed by the squashed alias; setdefault keeps the
+# first canonical field that lists an alias (e.g. "Legal" -> Legal, not Owner).
+# Squashing subsumes the plain lowercase match, so one dict lookup per column.
+_ALIAS_LUT = {}
+for _can, _aliases in HEADER_ALIASES.items():
+    for _a in [_can] + _aliases:
+        _ALIAS_LUT.setdefault(_squash(_a), _can)
+
 def normalize_headers(df_columns):
     """Return a dict mapping df column -> canonical field name using aliases and fuzzy match."""
-    mapping = {}
-    cols = list(df_columns)
-    norm = [str(c).strip() for c in cols]
-
-    # straight alias match first
-    for can, aliases in HEADER_ALIASES.items():
-        low_aliases = [a.lower() for a in aliases]
-        for i, c in enumerate(norm):
-            if c.lower() in low_aliases and cols[i] not in mapping:
-                mapping[cols[i]] = can
-
-    # fuzzy: remove non-alphanum and compare collapsed tokens
-    def squash(s): return re.sub(r"[^a-z0-9]+", "", str(s).lower())
-    unmapped = [c for c in cols if c not in mapping]
-    for c in unmapped:
-        sc = squash(c)
-        for can, aliases in HEADER_ALIASES.items():
-            if squash(can) == sc or any(squash(a) == sc for a in aliases):
-                mapping[c] = can
-                break
-    return mapping
+    return {c: _ALIAS_LUT[k] for c in df_columns if (k := _squash(c)) in _ALIAS_LUT}
 
 def _coerce_obj(v):
     # Accept dicts or JSON strings; otherwise return {}
@@ -1016,6 +1369,112 @@ def _coerce_obj(v):
             pass
     return {}
 
+# Excel cell -> stored value converters used by import_matters.
+# Cells pandas.read_excel would have read as missing (its default na_values) import as "".
+_NA_STRINGS = frozenset([
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+])
+
+def _cell_text(val):
+    if val is None or val != val:  # val != val: float NaN
+        return ""
+    if isinstance(val, str) and val in _NA_STRINGS:
+        return ""
+    if isinstance(val, datetime.datetime):
+        return val.date().isoformat()
+    if type(val) is float and val.is_integer():
+        val = int(val)  # calamine reports every number as float: 123.0 -> "123"
+    return str(val).strip()
+
+def _cell_date(val):
+    return normalize_date(_cell_text(val))
+
+def _cell_int(val):
+    if type(val) is int:
+        return val
+    try:
+        return int(float(_cell_text(val) or 0))
+    except Exception:
+        return 0
+
+def _open_sheet_rows(file_bytes, sheet):
+    """(row iterator, close callable) for one sheet of an uploaded workbook.
+
+    Uses python-calamine (Rust reader, much faster on big books) when it is
+    installed, otherwise openpyxl in read-only mode. `sheet` empty = first sheet.
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        CalamineWorkbook = None
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_filelike(io.BytesIO(file_bytes))
+        ws = wb.get_sheet_by_name(sheet) if sheet else wb.get_sheet_by_index(0)
+        return ws.iter_rows(), getattr(wb, "close", lambda: None)
+
+    import openpyxl
+    wb = openpyxl.load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
+    ws = wb[sheet] if sheet else wb.worksheets[0]
+    return ws.iter_rows(values_only=True), wb.close
+
+def _parse_import_rows(rows, has_header):
+    """(records, header mapping) from an iterator of sheet rows (see _open_sheet_rows)."""
+    first = next(rows, None)
+    if first is None:
+        header = []
+    elif has_header:
+        header = list(first)
+    else:
+        header = list(range(len(first)))
+        rows = itertools.chain([first], rows)
+
+    # Map headers -> canonical fields, as (column index, field) pairs;
+    # a repeated header name only counts the first time it appears
+    # Each mapped column gets its converter picked once here, so the row loop
+    # does no per-cell type dispatch.
+    mapping = normalize_headers(header)
+    mapped_cols = []
+    seen_cols = set()
+    for i, col in enumerate(header):
+        if col in mapping and col not in seen_cols:
+            seen_cols.add(col)
+            key = mapping[col]
+            mapped_cols.append((i, key, IMPORT_CONVERTERS.get(key, _cell_text)))
+
+    # unmapped fields keep these defaults
+    blank = {f: "" for f in FIELDS}
+    blank["Days with Legal"] = 0
+    blank["Total Cycle Time"] = 0
+
+    records = []
+    for row in rows:
+        rec = dict(blank)
+        n = len(row)
+        for i, key, conv in mapped_cols:
+            rec[key] = conv(row[i] if i < n else None)
+
+        # ---> DERIVE Date Closed if missing but cycle time present
+        if not rec.get("Date Closed") and rec.get("Date Received") and rec.get("Total Cycle Time", 0) > 0:
+            try:
+                d0 = datetime.date.fromisoformat(str(rec["Date Received"]))
+                rec["Date Closed"] = (d0 + datetime.timedelta(days=int(rec["Total Cycle Time"]))).isoformat()
+            except Exception:
+                rec["Date Closed"] = rec.get("Date Closed", "")
+
+        # skip empty rows
+        if rec.get("Ref") or rec.get("Counterparty"):
+            rec["id"] = new_id()
+            records.append(rec)
+    return records, mapping
+
+IMPORT_CONVERTERS = {
+    "Date Received": _cell_date,
+    "Date Closed": _cell_date,
+    "Days with Legal": _cell_int,
+    "Total Cycle Time": _cell_int,
+}
+
 def build_event_diff(evt: dict):
     """
     Return list of {field, before, after} rows for display.
@@ -1049,12 +1508,11 @@ def build_event_diff(evt: dict):
 @app.route("/import", methods=["GET","POST"])
 @login_required
 def import_matters():
-    import io
-    # Lazy import (clear error if pandas/openpyxl missing)
+    # Lazy import (clear error if openpyxl missing)
     try:
-        import pandas as pd
+        import openpyxl
     except Exception:
-        flash("Importer requires pandas (and openpyxl). Run: pip install -r requirements.txt", "danger")
+        flash("Importer requires openpyxl. Run: pip install -r requirements.txt", "danger")
         return redirect(url_for("dashboard"))
 
     if request.method == "GET":
@@ -1078,73 +1536,21 @@ def import_matters():
         flash("Uploaded file is empty.", "danger")
         return redirect(request.url)
 
+    # Stream rows straight out of the sheet (plain value sequences). Rows are
+    # parsed lazily, so read errors (e.g. a truncated sheet) can surface at
+    # any row: keep the whole parse under the same error handling.
     try:
-        bio = io.BytesIO(file_bytes)
-        if sheet:
-            df = pd.read_excel(bio, sheet_name=sheet, engine="openpyxl", header=0 if has_header else None)
-        else:
-            df = pd.read_excel(bio, engine="openpyxl", header=0 if has_header else None)
+        rows, close_wb = _open_sheet_rows(file_bytes, sheet)
     except Exception as e:
         flash(f"Could not read Excel: {e}", "danger")
         return redirect(request.url)
-
-    # If multiple sheets returned, pick a likely one
-    if isinstance(df, dict):
-        prefer = None
-        for k in df.keys():
-            lk = str(k).lower()
-            if any(key in lk for key in ["contract", "matter", "tracker"]):
-                prefer = k
-                break
-        df = df.get(prefer or list(df.keys())[0])
-
-    # Map headers -> canonical fields
-    mapping = normalize_headers(df.columns)
-
-    records = []
-    for _, row in df.iterrows():
-        rec = {f: "" for f in FIELDS}
-        rec.setdefault("Date Closed", "")
-
-        # copy values by mapped columns
-        for col, val in row.items():
-            if col in mapping:
-                key = mapping[col]
-                if pd.isna(val):
-                    v = ""
-                elif isinstance(val, pd.Timestamp):
-                    v = val.date().isoformat()
-                else:
-                    v = str(val)
-                rec[key] = v.strip()
-
-        # normalize dates
-        rec["Date Received"] = normalize_date(rec.get("Date Received"))
-        if rec.get("Date Closed"):
-            rec["Date Closed"] = normalize_date(rec.get("Date Closed"))
-
-        # ints
-        try:
-            rec["Days with Legal"] = int(float(rec.get("Days with Legal") or 0))
-        except Exception:
-            rec["Days with Legal"] = 0
-        try:
-            rec["Total Cycle Time"] = int(float(rec.get("Total Cycle Time") or 0))
-        except Exception:
-            rec["Total Cycle Time"] = 0
-
-        # ---> DERIVE Date Closed if missing but cycle time present
-        if not rec.get("Date Closed") and rec.get("Date Received") and rec.get("Total Cycle Time", 0) > 0:
-            try:
-                d0 = datetime.date.fromisoformat(str(rec["Date Received"]))
-                rec["Date Closed"] = (d0 + datetime.timedelta(days=int(rec["Total Cycle Time"]))).isoformat()
-            except Exception:
-                rec["Date Closed"] = rec.get("Date Closed", "")
-
-        # skip empty rows
-        if rec.get("Ref") or rec.get("Counterparty"):
-            rec["id"] = new_id()
-            records.append(rec)
+    try:
+        records, mapping = _parse_import_rows(rows, has_header)
+    except Exception as e:
+        flash(f"Could not read Excel: {e}", "danger")
+        return redirect(request.url)
+    finally:
+        close_wb()
 
     if not records:
         app.logger.warning("Import parsed zero records. Mapped columns: %s", mapping)
@@ -1158,10 +1564,12 @@ def import_matters():
         if name:
             owner_names.add(name)
     users = get_users()
+    existing = {u.get("name","").strip().lower() for u in users}
     changed = False
     for name in sorted(owner_names):
-        if not find_user_by_name(users, name):
+        if name.lower() not in existing:
             users.append({"id": new_id(), "name": name, "job_title": "", "function": ""})
+            existing.add(name.lower())
             changed = True
     if changed:
         save_users(users)
@@ -1171,10 +1579,17 @@ def import_matters():
         write_matters(records)
         flash(f"Imported {len(records)} matters (replaced existing).", "success")
     else:
-        existing = get_matters()
-        seen = {(m.get("Ref",""), m.get("Counterparty",""), m.get("Date Received","")) for m in existing}
-        new_items = [r for r in records if (r.get("Ref",""), r.get("Counterparty",""), r.get("Date Received","")) not in seen]
-        write_matters(existing + new_items)
+        # cached rows already have every FIELD, so the key can index directly
+        matters = get_matters_cached()
+        seen = {(m["Ref"], m["Counterparty"], m["Date Received"]) for m in matters}
+        new_items = []
+        for r in records:
+            key = (r["Ref"], r["Counterparty"], r["Date Received"])
+            if key not in seen:
+                seen.add(key)  # also drops repeats within the uploaded file
+                new_items.append(r)
+        # new list: the loaded one may still back cached indexes/other requests
+        write_matters(matters + new_items)
         flash(f"Imported {len(new_items)} new matters (skipped {len(records)-len(new_items)} possible duplicates).", "success")
 
     return redirect(url_for("matters_list"))
@@ -1234,7 +1649,7 @@ def owners_delete(uid):
         flash("Owner not found", "danger")
         return redirect(url_for("owners_list"))
     # Prevent deletion if referenced by matters
-    matters = get_matters()
+    matters = get_matters_cached()
     in_use = any((m.get("Owner","").strip().lower() == user["name"].strip().lower()) for m in matters)
     if in_use:
         flash("Cannot delete owner: they are assigned to one or more matters.", "warning")